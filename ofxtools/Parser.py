@@ -7,8 +7,9 @@ into standard Python `xml.etree.ElementTree.ElementTree` structures,
 which interface it implements.
 
 This module only parses the OFX message body, after the OFX header has been
-processed and stripped by the `ofxtools.header` module, which is where the
-call to `read()` occurs.
+processed by the `ofxtools.header` module.  The message body is scanned as
+raw bytes; only the text content of data-bearing elements is decoded, using
+the character set declared in the OFX header.
 
 Notwithstanding the fact that `ofxtools.TreeBuilder` subclasses the excellent
 `xml.etree.ElementTree.Treebuilder` by overriding a fairly minimal set of
@@ -17,7 +18,7 @@ methods, the logic is completely different - less efficient and far slower.
 If we didn't need to parse OFXv1 (SGML), we'd do better to skip it and
 just feed plain XML to `ElementTree`.
 
-The implementation employs re.finditer() and Perl extended regular expressions:
+The implementation employs re.findall() and Perl extended regular expressions:
 https://docs.python.org/3/howto/regex.html#non-capturing-and-named-groups
 
 No ponies were harmed during the production of this parser:
@@ -30,15 +31,16 @@ __all__ = ["OFXTree", "TreeBuilder", "ParseError"]
 
 # stdlib imports
 import re
+import sys
 import xml.etree.ElementTree as ET
-from typing import Tuple, Optional
+from typing import Tuple, Union, Generator
 import logging
 
 
 # local imports
 from ofxtools import config
-from ofxtools.header import parse_header, OFXHeaderType
-from ofxtools.models.base import Aggregate
+from ofxtools.header import read_header, OFXHeaderType
+from ofxtools.models.base import Aggregate, LazyAggregate
 
 
 logger = logging.getLogger(__name__)
@@ -82,13 +84,22 @@ class OFXTree(ET.ElementTree):
         """
         logger.info(f"Parsing OFX from {source}")
         # Stash the converted OFX header
-        self.header, message = self._read(source)
+        self.header, chunks = self._read(source)
         logger.debug(f"Parsed OFX header: {self.header}")
 
-        # If no parser specified, create default `ofxtools.Parser.TreeBuilder`
+        # If no parser specified, create default `ofxtools.Parser.TreeBuilder`.
+        # Either way, the message body is fed undecoded; the parser decodes
+        # element text according to the character set declared by the header.
         if parser is None:
-            parser = TreeBuilder()
-        parser.feed(message)
+            parser = TreeBuilder(codec=self.header.codec)
+        elif isinstance(parser, TreeBuilder):
+            parser.codec = self.header.codec
+        # Close the source even if parsing fails partway through the body
+        try:
+            for chunk in chunks:
+                parser.feed(chunk)
+        finally:
+            chunks.close()
 
         # ElementTree.TreeBuilder.close() returns the root.
         # Follow ElementTree API and stash as self._root (so all normal
@@ -99,10 +110,19 @@ class OFXTree(ET.ElementTree):
         return self._root
 
     @staticmethod
-    def _read(source) -> Tuple[OFXHeaderType, str]:
+    def _read(
+        source, chunksize: int = 2 ** 16
+    ) -> Tuple[OFXHeaderType, Generator[bytes, None, None]]:
         """
         Validate/convert OFX header and return it as an instance of
-        `ofxtools.header.OFXHeader{V1, V2}`, along with message body as `str`.
+        `ofxtools.header.OFXHeader{V1, V2}`, along with a generator over the
+        undecoded message body as `bytes`.
+
+        The message body is read lazily, *chunksize* bytes at a time, so that
+        the whole document never needs to be held in memory at once.  Each
+        chunk yielded is cut immediately before a tag's opening '<', so that
+        it contains only complete tokens; the remainder is carried over into
+        the next chunk.
 
         Factored out from `parse()` to facilitate unit testing.
         """
@@ -114,25 +134,67 @@ class OFXTree(ET.ElementTree):
         if hasattr(source, "mode") and "b" not in source.mode:
             raise ValueError("Source must be opened in binary mode")
 
-        try:
-            header, message = parse_header(source)
-        finally:
+        def close() -> None:
             if close_source and hasattr(source, "close"):
                 source.close()
 
-        return header, message
+        try:
+            header = read_header(source)
+        except Exception:
+            close()
+            raise
 
-    def convert(self) -> Aggregate:
+        def read_chunks() -> Generator[bytes, None, None]:
+            try:
+                buffer = b""
+                while True:
+                    chunk = source.read(chunksize)
+                    if not chunk:
+                        break
+                    buffer += chunk
+                    cut = buffer.rfind(b"<")
+                    if cut > 0:
+                        yield buffer[:cut]
+                        buffer = buffer[cut:]
+                if buffer:
+                    yield buffer
+            finally:
+                close()
+
+        return header, read_chunks()
+
+    def convert(self, lazy: bool = False) -> Union[Aggregate, LazyAggregate]:
         """
         Transform tree of `ElementTree.Element` instances into hierarchy of
         `ofxtools.models.base.Aggregate` & `ofxtools.Types.Element` instances.
+
+        If ``lazy`` is true, return a ``LazyAggregate`` proxy instead, which
+        converts subtrees only as they're accessed; cf. its docstring.
         """
         if not isinstance(self._root, ET.Element):
             raise ValueError("Must first call parse() to have data to convert")
+        if lazy:
+            return LazyAggregate(self._root)
         instance = Aggregate.from_etree(self._root)
         return instance
 
 
+class TagCache(dict):
+    """
+    Mapping of raw (ASCII-encoded) tags to decoded tags, filled on demand.
+
+    Decoded tags are interned, so that every ``Element.tag`` in the parsed
+    tree is the same string object as the corresponding attribute name in
+    ``ofxtools.models`` and the key of ``ofxtools.models.base.ATTRNAMES``;
+    downstream lookups of tags during conversion then succeed on identity
+    rather than string comparison.
+    """
+
+    def __missing__(self, key: bytes) -> str:
+        value = self[key] = sys.intern(key.decode("ascii"))
+        return value
+
+
 class TreeBuilder(ET.TreeBuilder):
     """
     OFX parser.
@@ -144,90 +206,172 @@ class TreeBuilder(ET.TreeBuilder):
     # The body of an OFX document consists of a series of tags.
     # Each start tag may be followed by text (if a data-bearing element)
     # and optionally an end tag (not mandatory for OFXv1 syntax).
+    #
+    # Each alternative below matches a distinct kind of token, captured in its
+    # own groups; exactly one kind's groups are nonempty in each match:
+    #   elemtag & text - data-bearing leaf (start tag & text)
+    #   endtag (& tail) - end tag, either of an aggregate or of the preceding
+    #       element, along with any (illegal) text following it
+    #   starttag - aggregate start tag
+    #
+    # Anything else (e.g. lowercase tags, or tags with attributes) isn't
+    # matched, and is skipped over.
+    #
+    # Whitespace surrounding text is consumed by the pattern itself, so the
+    # captured text arrives already stripped.  The pattern contains no
+    # backreferences or lazy quantifiers; the regex engine scans left to right,
+    # backtracking only over trailing whitespace.
+    # Whether an element has an explicit end tag is inferred from the next
+    # token rather than matched here; see ``feed()``.
     regex = re.compile(
-        r"""<(?P<tag>[A-Z0-9./_ ]+?)>
-                (?P<text>[^<]+)?
-            (</(?P<closetag>(?P=tag))>)?
-            (?P<tail>[^<]+)?
+        r"""<(?:(?P<elemtag>[A-Z0-9._ ][A-Z0-9./_ ]*)>
+                \s*(?P<text>[^<\s](?:[^<]*[^<\s])?)\s*
+                |/(?P<endtag>[A-Z0-9./_ ]+)>
+                (?:\s*(?P<tail>[^<\s](?:[^<]*[^<\s])?)\s*)?
+                |(?P<starttag>[A-Z0-9._ ][A-Z0-9./_ ]*)>)
         """,
         re.VERBOSE,
     )
 
-    def feed(self, data: str) -> None:
+    # The same pattern, for scanning undecoded markup.  The OFX markup itself
+    # is plain ASCII, and all the character sets allowed by the OFX header are
+    # ASCII-compatible, so tags & delimiters can be matched byte for byte.
+    bytes_regex = re.compile(regex.pattern.encode("ascii"), re.VERBOSE)
+
+    def __init__(
+        self,
+        *args,
+        codec: str = "utf_8",
+        skip_private: bool = True,
+        strict: bool = False,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        # Python codec used to decode element text from markup fed as bytes;
+        # cf. ``ofxtools.header.OFXHeaderV1.codec``
+        self.codec = codec
+        # Drop private extension elements, e.g. <INTU.BID>, which are
+        # discarded by ``Aggregate.groom()`` anyway.
+        self.skip_private = skip_private
+        # Raise ParseError for aggregate end tags that don't match the open
+        # aggregate.  By default they're accepted, and close it anyway; plenty
+        # of OFX in the wild (even samples in the OFX spec) omits end tags.
+        self.strict = strict
+        self._tags = TagCache()
+        # Tag of the most recently ended element, if it's still eligible
+        # to be matched by an explicit end tag.
+        self._leaf = None
+        # Number of bytes of markup fed so far, i.e. the position of the
+        # current ``feed()`` input within the whole message body.
+        self._offset = 0
+
+    def feed(self, data: Union[str, bytes]) -> None:
         """
-        Iterate through all tags matched by regex.
+        Tokenize markup in a single pass; dispatch on token kind.
+
+        Markup may be fed either as text or as bytes (undecoded OFX message
+        body).  Either way, it's scanned as bytes; tags are decoded as ASCII
+        and element text is decoded according to ``self.codec`` (UTF-8 for
+        markup fed as text).  Nothing else is decoded.
+
+        The whole scan runs inside the regex engine (``findall()``), which
+        hands back a list of plain tuples of groups; this loop only routes
+        them to ``start()`` / ``data()`` / ``end()``.
+
+        * An OFX "element" i.e. data-bearing leaf is pushed, its data written,
+          and popped.  End tags are optional for OFXv1 data elements;
+          end all elements, whether or not they're explicitly ended.
+          Private extension elements (tag contains a '.') are skipped
+          entirely, unless ``self.skip_private`` is false.
+        * An aggregate start tag pushes a new OFX "aggregate" branch to the
+          stack.
+        * An end tag pops an OFX "aggregate" branch from the stack.  If
+          ``self.strict`` is true, it must match the aggregate's start tag.
+          An end tag immediately following an element with the same tag is
+          that element's (optional) explicit end tag; it's already been
+          popped.
+        * Text following an end tag is illegal.
         """
         logger.info("Building Element tree from markup body")
-        for match in self.regex.finditer(data):
-            try:
-                groupdict = match.groupdict()
-
-                tail = self._groomstring(groupdict["tail"])
-                if tail:
-                    raise ParseError(f"Tail text '{tail}' in {match.string}")
-
-                tag = groupdict["tag"]
-                text = self._groomstring(groupdict["text"])
-                closetag = groupdict["closetag"]
-                logger.debug(
-                    f"Regex match tag='{tag}', text='{text}', closetag='{closetag}'"
-                )
-                self._feedmatch(tag, text, closetag)
-            except ParseError as err:
-                # Report the position of the error
-                msg = err.args[0]
-                msg += " - position=[{}:{}]".format(match.start(), match.end())
-                raise ParseError(msg)
-
-    def _feedmatch(
-        self, tag: str, text: Optional[str], closetag: Optional[str]
-    ) -> None:
-        """
-        Route individual regex matches to _start()/_end() according to tag.
-
-        This is factored out into a separate method to facilitate unit testing.
-        """
-        assert tag
-        assert closetag is None or closetag == tag
-        if tag.startswith("/"):
-            if text:
-                raise ParseError(f"Tail text '{text}' after <{tag}>")
-            logger.debug(f"Popping tag '{tag[1:]}'")
-            self.end(tag[1:])
+        # This loop runs once per tag in the document; bind everything it
+        # touches to local variables.
+        start = self.start
+        write = self.data
+        end = self.end
+        leaf = self._leaf
+        skip_private = self.skip_private
+        strict = self.strict
+
+        if isinstance(data, str):
+            # Encoding ASCII markup is a plain copy, after which we're on the
+            # same code path as undecoded OFX message bodies.
+            data = data.encode("utf_8")
+            codec = "utf_8"
         else:
-            self._start(tag, text, closetag)
-
-    def _start(self, tag: str, text: Optional[str], closetag: Optional[str]) -> None:
+            codec = self.codec
+        # Decoded tags are drawn from a small, fixed vocabulary; memoize them.
+        decode_tag = self._tags.__getitem__
+
+        # ``ET.TreeBuilder.end()`` pops the open element without checking it
+        # against the end tag, and returns it; in strict mode, check its tag
+        # directly rather than reaching into the builder's stack.  An end
+        # tag with no open element to close pops an empty stack; report it
+        # as a syntax error.  Wrapping the whole loop sets up the handler
+        # once, not per tag.
+        try:
+            for elemtag, text, endtag, tail, starttag in self.bytes_regex.findall(data):
+                if elemtag:
+                    tag = decode_tag(elemtag)
+                    if not (skip_private and "." in tag):
+                        start(tag, {})
+                        value = text.decode(codec)
+                        # The regex only trims ASCII whitespace; text bounded
+                        # by non-ASCII may carry e.g. a trailing NBSP.
+                        if text[0] > 0x7F or text[-1] > 0x7F:
+                            value = value.strip()
+                        write(value)
+                        end(tag)
+                    leaf = tag
+                elif starttag:
+                    start(decode_tag(starttag), {})
+                    leaf = None
+                else:
+                    # End tag, possibly followed by illegal tail text
+                    if tail:
+                        self._tail_error(data, codec)
+                    tag = decode_tag(endtag)
+                    if tag != leaf:
+                        opentag = end(tag).tag
+                        if strict and opentag != tag:
+                            raise ParseError(
+                                f"Mismatched end tag </{tag}>; expected </{opentag}>"
+                            )
+                    leaf = None
+        except IndexError as err:
+            raise ParseError(f"Unmatched end tag </{tag}>") from err
+
+        self._leaf = leaf
+        self._offset += len(data)
+
+    def _tail_error(self, data: bytes, codec: str) -> None:
         """
-        Push a new Element to the stack.
+        Raise ParseError for the first illegal tail text in ``data``.
 
-        * If there's text data, it's a leaf.  Write the data and pop it.
-        * If there's no text, it's a branch.
-            - If regex captured closetag, it's an empty "aggregate"; pop it.
+        ``findall()`` doesn't report positions, so scan again to find it.
+        Positions are reported relative to the whole of the markup fed so
+        far, not just ``data`` (which may be one chunk of a larger body).
         """
-        logger.debug(f"Pushing tag '{tag}'")
-        self.start(tag, {})
-        if text:
-            # OFX "element" i.e. data-bearing leaf
-            logger.debug(f"Data text '{text}'")
-            self.data(text)
-            # End tags are optional for OFXv1 data elements
-            # End all elements, whether or not they're explicitly ended
-            logger.debug(f"Popping tag '{tag}'")
-            self.end(tag)
-        elif closetag:
-            # Empty OFX "aggregate" branch
-            logger.debug(f"Popping tag '{closetag}'")
-            self.end(tag)
-
-    @staticmethod
-    def _groomstring(string: str) -> Optional[str]:
-        """ Strips whitespace and returns None for empty string """
-        # Can't strip() None
-        string = (string or "").strip()
-        if string:
-            return string
-        return None
+        for match in self.bytes_regex.finditer(data):
+            if match.group("tail"):
+                tail = match.group("tail").decode(codec)
+                # Quote the end tag along with the tail text following it
+                markup = match.group().decode(codec).strip()
+                # Report the position of the error
+                start = self._offset + match.start("tail")
+                end = self._offset + match.end("tail")
+                raise ParseError(
+                    f"Tail text '{tail}' in {markup} - position=[{start}:{end}]"
+                )
 
 
 def main(*files):
@@ -11,7 +11,8 @@ constructs class instances from strings, which is used in deserialization.
 
 This module provides the `parse_header()` function, which demarcates message
 header from message body in serialized OFX data, and processes the header
-portion.  See `ofxtools.Parser` for the rest of it.
+portion.  See `ofxtools.Parser` for the rest of it.  The `read_header()`
+function does the same, but leaves the message body unread in the source.
 
 Also provided is the `make_header()` utility function, which routes to the
 appropriate header class based on OFX version #.  It's used by
@@ -23,6 +24,7 @@ __all__ = [
     "OFXHeaderError",
     "OFXHeaderV1",
     "OFXHeaderV2",
+    "read_header",
     "parse_header",
     "make_header",
 ]
@@ -30,6 +32,7 @@ __all__ = [
 
 # stdlib imports
 import re
+import codecs
 import logging
 from typing import Tuple, Union, Optional, BinaryIO, Any
 
@@ -235,6 +238,10 @@ class OFXHeaderV2(OFXHeaderBase):
         return "\r\n".join((xml_decl, ofx_decl, ""))
 
 
+#  ASCII whitespace characters stripped by ``bytes.strip()``
+WHITESPACE = frozenset(b" \t\n\r\x0b\x0c")
+
+
 XML_REGEX = re.compile(
     r"""(<\?xml\s+
                        (version=\"(?P<xmlversion>[\d.]+)\")?\s*
@@ -245,21 +252,23 @@ XML_REGEX = re.compile(
 )
 
 
-def parse_header(source: BinaryIO) -> Tuple[OFXHeaderType, str]:
+def read_header(source: BinaryIO) -> OFXHeaderType:
     """
-    Consume source; feed to appropriate class constructor which performs
-    validation/type conversion on OFX header.
+    Consume OFX header from source; feed to appropriate class constructor
+    which performs validation/type conversion on OFX header.
 
-    Using header, locate/read/decode (but do not parse) OFX data body.
+    Reads no further than necessary; on return, ``source`` is positioned
+    at the beginning of the (unread, undecoded) OFX data body.
 
-    Returns a 2-tuple of:
-        * instance of OFXHeaderV1/OFXHeaderV2 containing parsed data, and
-        * decoded text of OFX data body
+    Returns an instance of OFXHeaderV1/OFXHeaderV2 containing parsed data.
     """
     logger.info("Parsing OFX header")
 
     # Skip any empty lines at the beginning
     while True:
+        # Absolute position of the current line, from which we measure the
+        # end of the header.
+        start = source.tell()
         # OFX header is read by nice clean machines, not meatbags -
         # should not contain 💩, 漢字, or what have you.
         line = source.readline().decode("ascii")
@@ -274,35 +283,64 @@ def parse_header(source: BinaryIO) -> Tuple[OFXHeaderType, str]:
         # OFX declaration, and data elements; ``line`` may or may not
         # contain the latter two.
         #
-        # Just rewind, read the whole file (it must be UTF-8 encoded per
-        # the spec) and slice the OFX data body from the end of the
-        # OFX declaration
-        source.seek(0)
-        decoded_source = source.read().decode(OFXHeaderV2.codec)
-        header, header_end_index = OFXHeaderV2.parse(decoded_source)
-        message = decoded_source[header_end_index:]
+        # Keep reading lines until we've got the OFX declaration.
+        HeaderClass: Any = OFXHeaderV2
+        rawheader = line
+        while not OFXHeaderV2.regex.search(rawheader):
+            nextline = source.readline()
+            if not nextline:
+                break
+            rawheader += nextline.decode(OFXHeaderV2.codec)
     else:
         logger.debug("No XML declaration - OFX version 1")
-        rawheader = line + "\n"
+        HeaderClass = OFXHeaderV1
+        rawheader = line
         # First line is OFXHEADER; need to read next 8 lines for a fixed
         # total of 9 fields required by OFX v1 spec.
         for n in range(8):
             rawheader += source.readline().decode("ascii")
-        header, header_end_index = OFXHeaderV1.parse(rawheader)
 
-        #  Input source stream position should have advanced to the beginning of
-        #  the OFX body tag soup, which is where subsequent calls
-        #  to read()/readlines() will pick up.
-        #
-        #  The seek call will correct the position when \r newline character is used
-        #  (Issue #84)
-        source.seek(header_end_index)
+    header, header_end_index = HeaderClass.parse(rawheader)
+
+    #  Rewind the input source stream position to the beginning of the
+    #  OFX body tag soup, which is where subsequent calls to read()/readlines()
+    #  will pick up.  ``rawheader`` may have overrun the end of the header
+    #  (e.g. if there are no line breaks), and may be terminated by \r newline
+    #  characters (Issue #84).
+    header_end = len(rawheader[:header_end_index].encode(header.codec))
+    source.seek(start + header_end)
+
+    return header
+
+
+def parse_header(source: BinaryIO) -> Tuple[OFXHeaderType, str]:
+    """
+    Consume source; feed to appropriate class constructor which performs
+    validation/type conversion on OFX header.
 
-        #  Decode the OFX data body according to the encoding declared
-        #  in the OFX header
-        message = source.read().decode(header.codec)
+    Using header, locate/read/decode (but do not parse) OFX data body.
 
-    return header, message.strip()
+    Returns a 2-tuple of:
+        * instance of OFXHeaderV1/OFXHeaderV2 containing parsed data, and
+        * decoded text of OFX data body
+    """
+    header = read_header(source)
+
+    #  Read the OFX data body in one go.  Trim surrounding whitespace by
+    #  slicing a view of the raw buffer, rather than copying the whole
+    #  decoded message with ``str.strip()``.
+    body = memoryview(source.read())
+    body_start, body_end = 0, len(body)
+    while body_start < body_end and body[body_start] in WHITESPACE:
+        body_start += 1
+    while body_end > body_start and body[body_end - 1] in WHITESPACE:
+        body_end -= 1
+
+    #  Decode the OFX data body according to the encoding declared
+    #  in the OFX header
+    message = codecs.decode(body[body_start:body_end], header.codec)
+
+    return header, message
 
 
 def make_header(
@@ -18,13 +18,13 @@ the OFX spec, to be found in the package namespace by
 """
 
 
-__all__ = ["Aggregate", "ElementList"]
+__all__ = ["Aggregate", "ElementList", "LazyAggregate"]
 
 
 # stdlib imports
+import sys
 import xml.etree.ElementTree as ET
-from copy import deepcopy
-import functools
+from copy import copy
 from typing import (
     Any,
     Dict,
@@ -34,7 +34,6 @@ from typing import (
     Mapping,
     Union,
     Optional,
-    ChainMap,
 )
 import logging
 
@@ -49,6 +48,22 @@ from ofxtools.utils import classproperty
 logger = logging.getLogger(__name__)
 
 
+#  Memoized mapping of OFX tag to Python attribute name, i.e. ``tag.lower()``.
+#  OFX documents are built from a small, fixed vocabulary of tags that recur
+#  over and over (STMTTRN, SECID, etc.), so this is nearly always a cache hit.
+#  Only tags found in some ``Aggregate.spec`` are memoized.
+#  Attribute names are interned, like the parser's tags, so that lookups in
+#  ``spec_index`` and class ``__dict__`` compare by identity.
+ATTRNAMES: Dict[str, str] = {}
+
+#  Memoized results of ``Aggregate._filter_attrs()`` for the classproperties
+#  classifying ``Aggregate`` attributes (``spec``, ``listaggregates``, etc.),
+#  keyed by (class, property name).  These are consulted for every instance
+#  converted, but depend only on the class definition, so each need only be
+#  computed once per class.
+FILTERED_ATTRS: Dict[Tuple[type, str], Mapping[str, Any]] = {}
+
+
 class OFXAggregateError(ValueError):
     """ Base class for errors in this module """
 
@@ -71,6 +86,10 @@ class Aggregate(list):
     # Aggregate MUST contain exactly one child from ``requiredMutexes``
     requiredMutexes: Sequence[Sequence[str]] = []
 
+    # Tags of child elements renamed by ``groom()``, e.g. to avoid name
+    # collisions with Python reserved keywords; mapping of OFX tag: new tag.
+    renames: Mapping[str, str] = {}
+
     def __init__(self, *args, **kwargs):
         """
         Positional args interepreted as list items (of variable #).
@@ -201,40 +220,55 @@ class Aggregate(list):
         return instance
 
     @classmethod
-    def _convert(cls, elem: ET.Element) -> "Aggregate":
+    def _convert(
+        cls,
+        elem: ET.Element,
+        converted: Optional[Mapping[str, Optional["Aggregate"]]] = None,
+    ) -> "Aggregate":
         """Instantiate from ``xml.etree.ElementTree.Element``.
 
+        ``converted`` optionally maps attribute names to SubAggregates that
+        have already been converted from child Elements (cf. ``LazyAggregate``);
+        these are used as is rather than converted again.
+
         N.B. this method must be called on the appropriate subclass,
         not the ``Aggregate`` base class.
         """
         if len(elem) == 0:
             return cls()
+        if converted is None:
+            converted = {}
 
         # Hook to modify incoming ``ET.Element`` before conversion
         elem = cls.groom(elem)
 
         clsnm = cls.__name__
-        spec = list(cls.spec)
+        spec = cls.spec
+        #  Index of each attribute within the ``Aggregate.spec`` sequence,
+        #  computed once per conversion rather than searched for each child.
+        spec_index = {attrname: index for index, attrname in enumerate(spec)}
         listaggregates = cls.listaggregates
         listelements = cls.listelements
+        unsupported = cls.unsupported
 
-        #  Type alias - accumulator for functools.reduce()
-        Accum = Tuple[list, dict, int, bool]
-        " args, kwargs, previous attr index within spec, previous attr is list member? "
-
-        def update_args(accum: Accum, elem: ET.Element) -> Accum:
-            """Extend ``functools.reduce()`` accumulator with parsed ``ET.Element``
-            value (either OFX `aggregate` or OFX 'element').
-
-            List members are stored as positional args (i.e. list); everything
-            else is stored as keyword args (i.e. dict).
+        #  List members are stored as positional args (i.e. list); everything
+        #  else is stored as keyword args (i.e. dict).
+        args: list = []
+        kwargs: dict = {}
+        prev_index = -1
+        prev_is_listmember = False
 
-            Check index within the ``Aggregate.spec`` sequence against previous
-            ``ET.Element`` and return sequencing info for current ``ET.Element``
-            to be used in the next iteration.
-            """
-            args, kwargs, prev_index, prev_is_listmember = accum
-            attrname = elem.tag.lower()
+        #  ElementTree API: child Elements stored as a sequence, accessible
+        #  by iterating over the parent Element.
+        #  https://effbot.org/zone/pythondoc-elementtree-ElementTree.htm#elementtree.ElementTree._ElementInterface-class
+        for subelem in elem:
+            tag = subelem.tag
+            try:
+                attrname = ATTRNAMES[tag]
+                cache_attrname = False
+            except KeyError:
+                attrname = tag.lower()
+                cache_attrname = True
 
             #  OFX messages have a sequence order defined by the spec.  This order maps
             #  to the order of class attributes defined by ``Aggregate`` subclasses.
@@ -245,10 +279,15 @@ class Aggregate(list):
             #  occur in any order, so we don't validate the relative order of list
             #  members.  Other than, we require that the index of an attribute within
             #  the ``Aggregate.spec`` sequence must increase monotonically.
-            try:
-                index = spec.index(attrname)
-            except ValueError:
-                raise OFXSpecError(f"{clsnm}.spec = {spec}; doesn't contain {attrname}")
+            index = spec_index.get(attrname)
+            if index is None:
+                raise OFXSpecError(
+                    f"{clsnm}.spec = {list(spec)}; doesn't contain {attrname}"
+                )
+            if cache_attrname:
+                #  Only memoize tags known to the spec, so that arbitrary input
+                #  can't grow the cache without bound.
+                attrname = ATTRNAMES[tag] = sys.intern(attrname)
 
             is_listmember = attrname in listaggregates or attrname in listelements
             if index <= prev_index and not (is_listmember and prev_is_listmember):
@@ -256,15 +295,17 @@ class Aggregate(list):
                 raise OFXSpecError(f"{clsnm} SubElements out of order: {subels}")
 
             # Parse attribute value
-            if attrname in cls.unsupported:
+            if attrname in unsupported:
                 value: Optional[Union[str, Aggregate]] = None
-            elif elem.text:
+            elif subelem.text:
                 # Element - extract as string; value will be type-converted upon
                 # instance initialization by ``ofxtools.Types.Element.__set__()``.
-                value = elem.text
+                value = subelem.text
+            elif attrname in converted:
+                value = converted[attrname]
             else:
                 # Aggregate - recurse
-                value = Aggregate.from_etree(elem)
+                value = Aggregate.from_etree(subelem)
 
             # Append attr value to args (list members) or kwargs (everything else)
             if is_listmember:
@@ -274,34 +315,46 @@ class Aggregate(list):
                     raise OFXSpecError
                 kwargs[attrname] = value
 
-            return args, kwargs, index, is_listmember
+            prev_index, prev_is_listmember = index, is_listmember
 
-        #  ElementTree API: child Elements stored as a sequence, accessible
-        #  by iterating over the parent Element.
-        #  https://effbot.org/zone/pythondoc-elementtree-ElementTree.htm#elementtree.ElementTree._ElementInterface-class
-        initial: Accum = ([], {}, -1, False)
-        args, kwargs = functools.reduce(update_args, elem, initial)[:2]
         return cls(*args, **kwargs)
 
-    @staticmethod
-    def groom(elem: ET.Element) -> ET.Element:
+    @classmethod
+    def groom(cls, elem: ET.Element) -> ET.Element:
         """
         Modify incoming ``ET.Element`` to play nice with our Python schema.
 
-        Default action is to remove extended tags, e.g. INTU.XXX
+        Default action is to remove extended tags, e.g. INTU.XXX, and to
+        rename child tags listed in ``cls.renames``.
 
         Extend in subclass.
 
-        N.B. make sure to perform modifications on a copy.deepcopy(), in order
-        to keep the input free of side effects!
+        N.B. make sure to keep the input free of side effects!  Only the
+        immediate children are modified here, so a shallow copy suffices;
+        the input is returned as is if there's nothing to modify.
         """
-        elem = deepcopy(elem)
-
-        for child in set(elem):
-            if "." in child.tag:
-                logger.debug(f"Removing extended tag <{child.tag}>")
-                elem.remove(child)
+        renames = cls.renames
+        children = []
+        modified = False
 
+        for child in elem:
+            tag = child.tag
+            if "." in tag:
+                logger.debug(f"Removing extended tag <{tag}>")
+                modified = True
+                continue
+            if tag in renames:
+                logger.debug(f"Renaming <{tag}> to <{renames[tag]}>")
+                child = copy(child)
+                child.tag = renames[tag]
+                modified = True
+            children.append(child)
+
+        if not modified:
+            return elem
+
+        elem = copy(elem)
+        elem[:] = children
         return elem
 
     def to_etree(self) -> ET.Element:
@@ -341,16 +394,30 @@ class Aggregate(list):
     def _listAppend(self, root: ET.Element, member) -> None:
         root.append(member.to_etree())
 
-    @staticmethod
-    def ungroom(elem: ET.Element) -> ET.Element:
+    @classmethod
+    def ungroom(cls, elem: ET.Element) -> ET.Element:
         """
         Reverse groom() when converting back to ElementTree.
 
-        Override in subclass.
+        Default action is to restore child tags renamed per ``cls.renames``.
 
-        N.B. make sure to perform modifications on a copy.deepcopy(), in order
-        to keep the input free of side effects.
+        Extend in subclass.
+
+        N.B. make sure to keep the input free of side effects.
         """
+        if not cls.renames:
+            return elem
+
+        unrenames = {v: k for k, v in cls.renames.items()}
+        elem = copy(elem)
+        for index, child in enumerate(elem):
+            tag = child.tag
+            if tag in unrenames:
+                logger.debug(f"Renaming <{tag}> to <{unrenames[tag]}>")
+                child = copy(child)
+                child.tag = unrenames[tag]
+                elem[index] = child
+
         return elem
 
     @classproperty
@@ -363,20 +430,26 @@ class Aggregate(list):
         of class attributes of ``ofxtools.models.base.Aggregate`` subclasses.
 
         That ordering is implemented by combining `PEP 520`_ (which was implemented
-        as of Python 3.6), `collections.ChainMap`_, and Python's `inheritance chain`_
+        as of Python 3.6), ordered ``dict`` updates, and Python's `inheritance chain`_
         (i.e. the MRO).
 
         PEP 520 guarantees that each class's ``__dict__`` preserves the order in which
-        its attributes and methods were defined.  ``ChainMap`` searches its list of
-        mappings from left to right.  By feeding a class's MRO into ``ChainMap``, we
-        get an ordering where attributes defined on subclasses override those defined
-        on the parent, preserving the order of the class definition in each case.
+        its attributes and methods were defined.  Updating a single ``dict`` with the
+        ``__dict__`` of each class in the MRO, from the root down to ``cls``, we get an
+        ordering where attributes defined on subclasses override those defined on the
+        parent, preserving the order of the class definition in each case.  (This is
+        the same ordering as iterating over a `collections.ChainMap`_ of the MRO, but
+        each attribute is hashed into one flat ``dict`` once, rather than searched for
+        through every class in the MRO on each lookup.)
 
         .. _PEP 520: https://www.python.org/dev/peps/pep-0520/
         .. _collections.ChainMap: https://docs.python.org/3/library/collections.html#collections.ChainMap
         .. _inheritance order: https://www.python.org/download/releases/2.3/mro/
         """
-        return ChainMap(*[base.__dict__ for base in cls.mro()])
+        superdict: Dict[str, Any] = {}
+        for base in reversed(cls.mro()):
+            superdict.update(base.__dict__)
+        return superdict
 
     @classmethod
     def _filter_attrs(cls, predicate: Callable) -> Mapping[str, Any]:
@@ -405,6 +478,22 @@ class Aggregate(list):
         """
         return {k: v for k, v in cls._superdict.items() if predicate(v)}
 
+    @classmethod
+    def _filter_attrs_memoized(
+        cls, name: str, predicate: Callable
+    ) -> Mapping[str, Any]:
+        """
+        Memoized ``_filter_attrs()``, for classproperties named ``name``.
+
+        Returns a copy of the memoized mapping, which callers are free to modify.
+        """
+        key = (cls, name)
+        try:
+            attrs = FILTERED_ATTRS[key]
+        except KeyError:
+            attrs = FILTERED_ATTRS[key] = cls._filter_attrs(predicate)
+        return dict(attrs)
+
     @classproperty
     @classmethod
     def spec(cls) -> Mapping[str, Union[Types.Element, Types.Unsupported]]:
@@ -415,7 +504,8 @@ class Aggregate(list):
 
         N.B. Types.SubAggregate is a subclass of Element.
         """
-        return cls._filter_attrs(
+        return cls._filter_attrs_memoized(
+            "spec",
             lambda v: isinstance(v, (Types.Element, Types.Unsupported))
         )
 
@@ -428,7 +518,8 @@ class Aggregate(list):
         Mapping of all class attributes that are
         Elements/SubAggregates/Unsupported, excluding ListAggregates/ListElements.
         """
-        return cls._filter_attrs(
+        return cls._filter_attrs_memoized(
+            "spec_no_listaggregates",
             lambda v: isinstance(v, (Types.Element, Types.Unsupported))
             and not isinstance(v, (Types.ListAggregate, Types.ListElement))
         )
@@ -441,7 +532,8 @@ class Aggregate(list):
 
         N.B. Types.SubAggregate is a subclass of Element.
         """
-        return cls._filter_attrs(
+        return cls._filter_attrs_memoized(
+            "elements",
             lambda v: isinstance(v, Types.Element)
             and not isinstance(v, Types.SubAggregate)
         )
@@ -452,7 +544,9 @@ class Aggregate(list):
         """
         Mapping of all class attributes that are SubAggregates.
         """
-        return cls._filter_attrs(lambda v: isinstance(v, Types.SubAggregate))
+        return cls._filter_attrs_memoized(
+            "subaggregates", lambda v: isinstance(v, Types.SubAggregate)
+        )
 
     @classproperty
     @classmethod
@@ -460,7 +554,9 @@ class Aggregate(list):
         """
         Mapping of all class attributes that are Unsupported.
         """
-        return cls._filter_attrs(lambda v: isinstance(v, Types.Unsupported))
+        return cls._filter_attrs_memoized(
+            "unsupported", lambda v: isinstance(v, Types.Unsupported)
+        )
 
     @classproperty
     @classmethod
@@ -468,7 +564,9 @@ class Aggregate(list):
         """
         Mapping of all class attributes that are ListAggregates.
         """
-        return cls._filter_attrs(lambda v: isinstance(v, Types.ListAggregate))
+        return cls._filter_attrs_memoized(
+            "listaggregates", lambda v: isinstance(v, Types.ListAggregate)
+        )
 
     @classproperty
     @classmethod
@@ -476,7 +574,9 @@ class Aggregate(list):
         """
         Mapping of all class attributes that are ListElements.
         """
-        return cls._filter_attrs(lambda v: isinstance(v, Types.ListElement))
+        return cls._filter_attrs_memoized(
+            "listelements", lambda v: isinstance(v, Types.ListElement)
+        )
 
     @property
     def _spec_repr(self) -> Sequence[Tuple[str, Any]]:
@@ -533,7 +633,9 @@ class ElementList(Aggregate):
         """
         ElementList.listaggregates returns ListElements instead of ListAggregates
         """
-        return cls._filter_attrs(lambda v: isinstance(v, Types.ListElement))
+        return cls._filter_attrs_memoized(
+            "listaggregates", lambda v: isinstance(v, Types.ListElement)
+        )
 
     def _apply_args(self, *args) -> None:
         # Interpret positional args as contained list items (of variable #)
@@ -549,3 +651,102 @@ class ElementList(Aggregate):
 
         text = converter.unconvert(member)
         ET.SubElement(root, attr.upper()).text = text
+
+
+class LazyAggregate:
+    """
+    Proxy for the ``Aggregate`` converted from an ``ET.Element``, deferring
+    conversion until its attributes are accessed.
+
+    SubAggregates are converted from their own subtrees upon first access,
+    and memoized; other subtrees are never converted unless asked for.
+    Properties of the ``Aggregate`` subclass (e.g. ``OFX.statements``) are
+    evaluated against the proxy, so they convert only the SubAggregates
+    they use.  Anything else is delegated to the fully converted
+    ``Aggregate`` (see ``aggregate`` below), which is built around the
+    SubAggregates already converted.
+
+    N.B. validation of the ``Aggregate`` as a whole is deferred until it's
+    fully converted, so invalid data in subtrees that are never accessed
+    goes unreported.
+    """
+
+    def __init__(self, elem: ET.Element):
+        if not isinstance(elem, ET.Element):
+            msg = f"Bad type {type(elem)} - should be xml.etree.ElementTree.Element"
+            raise TypeError(msg)
+        try:
+            SubClass = getattr(ofxtools.models, elem.tag)
+        except AttributeError:
+            raise OFXSpecError(f"ofxtools.models doesn't define {elem.tag}")
+
+        self._elem = elem
+        self._cls = SubClass
+        self._instance: Optional[Aggregate] = None
+        self._subaggregates: Dict[str, Optional[Aggregate]] = {}
+
+        #  Classify the class attributes once here, rather than upon each
+        #  attribute access: SubAggregates (other than list members) that
+        #  may be converted on demand, and getters of properties to evaluate
+        #  against the proxy.
+        self._lazy = frozenset(
+            SubClass.subaggregates.keys() - SubClass.listaggregates.keys()
+        )
+        self._properties: Dict[str, Callable] = {
+            name: prop.fget
+            for name, prop in SubClass._superdict.items()
+            if isinstance(prop, property)
+            and not isinstance(prop, classproperty)
+            and prop.fget is not None
+        }
+
+    @property
+    def aggregate(self) -> Aggregate:
+        """ The fully converted ``Aggregate``, converting it on first access """
+        if self._instance is None:
+            # Reuse any SubAggregates already converted on demand, so that
+            # each attribute yields the same instance before & after.
+            self._instance = self._cls._convert(self._elem, self._subaggregates)
+        return self._instance
+
+    def __getattr__(self, attr: str):
+        #  Private attributes (including our own, before ``__init__()`` has set
+        #  them, e.g. when copying) aren't proxied.
+        if attr.startswith("_"):
+            cls = self.__class__.__name__
+            raise AttributeError(f"'{cls}' object has no attribute '{attr}'")
+
+        if self._instance is not None:
+            return getattr(self._instance, attr)
+
+        subaggregates = self._subaggregates
+        if attr in subaggregates:
+            return subaggregates[attr]
+
+        if attr in self._lazy:
+            subelem = self._elem.find(attr.upper())
+            if subelem is None:
+                value = None
+            else:
+                logger.info(f"Converting <{subelem.tag}> on demand")
+                value = Aggregate.from_etree(subelem)
+            subaggregates[attr] = value
+            return value
+
+        fget = self._properties.get(attr)
+        if fget is not None:
+            return fget(self)
+
+        return getattr(self.aggregate, attr)
+
+    def __len__(self) -> int:
+        return len(self.aggregate)
+
+    def __iter__(self):
+        return iter(self.aggregate)
+
+    def __getitem__(self, key):
+        return self.aggregate[key]
+
+    def __repr__(self) -> str:
+        return repr(self.aggregate)
@@ -24,7 +24,6 @@ __all__ = [
 
 
 # stdlib imports
-from copy import deepcopy
 import logging
 
 
@@ -41,6 +40,9 @@ logger = logging.getLogger(__name__)
 class MAIL(Aggregate):
     """ OFX section 9.2.2 """
 
+    # Rename reserved Python keywords; see ``Aggregate.groom()``
+    renames = {"FROM": "FRM"}
+
     userid = String(32, required=True)
     dtcreated = DateTime(required=True)
     frm = String(32, required=True)
@@ -50,36 +52,6 @@ class MAIL(Aggregate):
     incimages = Bool(required=True)
     usehtml = Bool(required=True)
 
-    @staticmethod
-    def groom(elem):
-        """
-        Rename all Elements tagged FROM (reserved Python keyword) to FROM
-        """
-        # Keep input free of side effects
-        elem = deepcopy(elem)
-
-        frm = elem.find("./FROM")
-        if frm is not None:
-            logger.debug("Renaming <FROM> to <FRM>")
-            frm.tag = "FRM"
-
-        return super(MAIL, MAIL).groom(elem)
-
-    @staticmethod
-    def ungroom(elem):
-        """
-        Rename FRM back to FROM
-        """
-        # Keep input free of side effects
-        elem = deepcopy(elem)
-
-        frm = elem.find("./FRM")
-        if frm is not None:
-            logger.debug("Renaming <FRM> to <FROM>")
-            frm.tag = "FROM"
-
-        return super(MAIL, MAIL).ungroom(elem)
-
 
 class MAILRQ(Aggregate):
     """ OFX section 9.2.3 """
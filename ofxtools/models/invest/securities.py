@@ -26,7 +26,6 @@ __all__ = [
 
 
 # stdlib imports
-from copy import deepcopy
 import logging
 
 
@@ -148,6 +147,9 @@ class FIMFASSETCLASS(Aggregate):  # pylint: disable=too-many-ancestors
 class MFINFO(Aggregate):
     """ OFX section 13.8.5.3 """
 
+    # Rename reserved Python keywords; see ``Aggregate.groom()``
+    renames = {"YIELD": "YLD"}
+
     secinfo = SubAggregate(SECINFO, required=True)
     mftype = OneOf("OPENEND", "CLOSEEND", "OTHER")
     yld = Decimal()
@@ -155,36 +157,6 @@ class MFINFO(Aggregate):
     mfassetclass = SubAggregate(MFASSETCLASS)
     fimfassetclass = SubAggregate(FIMFASSETCLASS)
 
-    @staticmethod
-    def groom(elem):
-        """
-        Rename all Elements tagged YIELD (reserved Python keyword) to YLD
-        """
-        # Keep input free of side effects
-        elem = deepcopy(elem)
-
-        yld = elem.find("./YIELD")
-        if yld is not None:
-            logger.debug("Renaming <YIELD> to <YLD>")
-            yld.tag = "YLD"
-
-        return super(MFINFO, MFINFO).groom(elem)
-
-    @staticmethod
-    def ungroom(elem):
-        """
-        Rename YLD back to YIELD
-        """
-        # Keep input free of side effects
-        elem = deepcopy(elem)
-
-        yld = elem.find("./YLD")
-        if yld is not None:
-            logger.debug("Renaming <YLD> to <YIELD>")
-            yld.tag = "YIELD"
-
-        return super(MFINFO, MFINFO).ungroom(elem)
-
 
 class OPTINFO(Aggregate):
     """ OFX Section 13.8.5.4 """
@@ -211,6 +183,9 @@ class OTHERINFO(Aggregate):
 class STOCKINFO(Aggregate):
     """ OFX Section 13.8.5.6 """
 
+    # Rename reserved Python keywords; see ``Aggregate.groom()``
+    renames = {"YIELD": "YLD"}
+
     secinfo = SubAggregate(SECINFO, required=True)
     stocktype = OneOf("COMMON", "PREFERRED", "CONVERTIBLE", "OTHER")
     yld = Decimal()
@@ -219,36 +194,6 @@ class STOCKINFO(Aggregate):
     assetclass = OneOf(*ASSETCLASSES)
     fiassetclass = String(32)
 
-    @staticmethod
-    def groom(elem):
-        """
-        Rename all Elements tagged YIELD (reserved Python keyword) to YLD
-        """
-        # Keep input free of side effects
-        elem = deepcopy(elem)
-
-        yld = elem.find("./YIELD")
-        if yld is not None:
-            logger.debug("Renaming <YIELD> to <YLD>")
-            yld.tag = "YLD"
-
-        return super(STOCKINFO, STOCKINFO).groom(elem)
-
-    @staticmethod
-    def ungroom(elem):
-        """
-        Rename YLD back to YIELD
-        """
-        # Keep input free of side effects
-        elem = deepcopy(elem)
-
-        yld = elem.find("./YLD")
-        if yld is not None:
-            logger.debug("Renaming <YLD> to <YIELD>")
-            yld.tag = "YIELD"
-
-        return super(STOCKINFO, STOCKINFO).ungroom(elem)
-
 
 class SECLIST(Aggregate):
     """ OFX section 13.8.4.4 """
@@ -307,6 +307,27 @@ class OFXHeaderV1TestCase(unittest.TestCase, OFXHeaderTestMixin):
 
         self.assertEqual(body, self.body)
 
+    def testReadHeader(self):
+        # read_header() leaves the source positioned at the start of the body,
+        # even when preceded by blank lines.
+        header = str(self.headerClass(self.defaultVersion))
+        ofx = "\r\n\r\n" + header + self.body
+        ofx = BytesIO(ofx.encode("ascii"))
+        ofxheader = ofxtools.header.read_header(ofx)
+
+        self.assertIsInstance(ofxheader, self.headerClass)
+        self.assertEqual(ofxheader.version, self.defaultVersion)
+        self.assertEqual(ofx.read().decode("ascii").strip(), self.body)
+
+    def testReadHeaderBodyOnLastHeaderLine(self):
+        # Body immediately follows the last header field, without a line break
+        header = str(self.headerClass(self.defaultVersion)).strip()
+        ofx = header.replace("\r\n", "\n") + self.body
+        ofx = BytesIO(ofx.encode("ascii"))
+        ofxtools.header.read_header(ofx)
+
+        self.assertEqual(ofx.read().decode("ascii"), self.body)
+
     def testExtraWhitespaceHeaderDemarc(self):
         # Even though it breaks with the OFX spec, some FIs insert whitespace
         # after the colon demarc between an OFX header field and its value.
@@ -462,6 +483,17 @@ class OFXHeaderV2TestCase(unittest.TestCase, OFXHeaderTestMixin):
         )
         self.assertEqual(str(header).strip(), headerStr.strip())
 
+    def testReadHeader(self):
+        # read_header() leaves the source positioned at the start of the body
+        header = str(self.headerClass(self.defaultVersion))
+        ofx = header + self.body
+        ofx = BytesIO(ofx.encode("utf8"))
+        ofxheader = ofxtools.header.read_header(ofx)
+
+        self.assertIsInstance(ofxheader, self.headerClass)
+        self.assertEqual(ofxheader.version, self.defaultVersion)
+        self.assertEqual(ofx.read().decode("utf8").strip(), self.body)
+
     def testParseHeader(self):
         # Test parse_header() for version 2
         header = str(self.headerClass(self.defaultVersion))
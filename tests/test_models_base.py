@@ -16,8 +16,10 @@ from ofxtools.Types import (
     ListElement,
 )
 from ofxtools.models.base import (
+    ATTRNAMES,
     Aggregate,
     ElementList,
+    LazyAggregate,
     OFXSpecError,
 )
 
@@ -47,6 +49,13 @@ class TESTAGGREGATE2(Aggregate):
     metadata = String(32, required=True)
 
 
+class TESTRENAMES(Aggregate):
+    metadata = String(32)
+    frm = String(32)
+
+    renames = {"FROM": "FRM"}
+
+
 class TESTLIST(Aggregate):
     metadata = String(32)
     testaggregate = ListAggregate(TESTAGGREGATE)
@@ -295,15 +304,66 @@ class AggregateTestCase(unittest.TestCase):
 
         self.assertIn("out of order", exc.exception.args[0].lower())
 
+    def testFromEtreeUnknownTag(self):
+        # Tags rejected by the spec aren't memoized as attribute names
+        root = ET.Element("TESTAGGREGATE")
+        ET.SubElement(root, "METADATA").text = "metadata"
+        ET.SubElement(root, "NOSUCHTAG").text = "Y"
+
+        with self.assertRaises(OFXSpecError):
+            Aggregate.from_etree(root)
+        self.assertEqual(ATTRNAMES["METADATA"], "metadata")
+        self.assertNotIn("NOSUCHTAG", ATTRNAMES)
+
     def testFromEtreeBadArg(self):
         with self.assertRaises(TypeError):
             Aggregate.from_etree(None)
 
     def testGroom(self):
-        pass
+        root = ET.Element("TESTRENAMES")
+        ET.SubElement(root, "METADATA").text = "metadata"
+        ET.SubElement(root, "INTU.BID").text = "3000"
+        ET.SubElement(root, "FROM").text = "from"
+
+        # Private tags are dropped; tags in ``renames`` are renamed
+        groomed = TESTRENAMES.groom(root)
+        self.assertIsNot(groomed, root)
+        self.assertEqual([el.tag for el in groomed], ["METADATA", "FRM"])
+        self.assertEqual(groomed[1].text, "from")
+
+        # The input is left unmodified
+        self.assertEqual([el.tag for el in root], ["METADATA", "INTU.BID", "FROM"])
+        self.assertEqual(root[2].text, "from")
+
+    def testGroomUnmodified(self):
+        # Input with nothing to groom is returned as is
+        root = ET.Element("TESTRENAMES")
+        ET.SubElement(root, "METADATA").text = "metadata"
+        ET.SubElement(root, "FRM").text = "frm"
+        self.assertIs(TESTRENAMES.groom(root), root)
+        self.assertEqual([el.tag for el in root], ["METADATA", "FRM"])
 
     def testUngroom(self):
-        pass
+        root = ET.Element("TESTRENAMES")
+        ET.SubElement(root, "METADATA").text = "metadata"
+        ET.SubElement(root, "FRM").text = "from"
+
+        # Tags in ``renames`` are renamed back
+        ungroomed = TESTRENAMES.ungroom(root)
+        self.assertIsNot(ungroomed, root)
+        self.assertEqual([el.tag for el in ungroomed], ["METADATA", "FROM"])
+        self.assertEqual(ungroomed[1].text, "from")
+
+        # The input is left unmodified
+        self.assertEqual([el.tag for el in root], ["METADATA", "FRM"])
+
+        # Aggregates without ``renames`` return the input as is
+        self.assertIs(TESTAGGREGATE.ungroom(root), root)
+
+    def testToEtreeRenames(self):
+        root = TESTRENAMES(metadata="metadata", frm="from").to_etree()
+        self.assertEqual([el.tag for el in root], ["METADATA", "FROM"])
+        self.assertEqual(root[1].text, "from")
 
     def testFilterAttrs(self):
         """
@@ -446,6 +506,15 @@ class AggregateTestCase(unittest.TestCase):
         self.assertEqual(name, "dontuse")
         self.assertIsInstance(instance, Unsupported)
 
+    def testSpecMemoized(self):
+        # Class attributes are classified once; each lookup returns a fresh
+        # copy, so callers modifying the result don't affect later lookups.
+        spec = TESTAGGREGATE.spec
+        self.assertIsNot(spec, TESTAGGREGATE.spec)
+        spec.clear()
+        self.assertEqual(len(TESTAGGREGATE.spec), 11)
+        self.assertEqual(len(TESTAGGREGATE.unsupported), 1)
+
     def testSpecRepr(self):
         #  Sequence of (name, repr()) for each non-empty attribute in ``_spec``
         spec_repr = self.instance_no_subagg._spec_repr
@@ -493,6 +562,86 @@ class AggregateTestCase(unittest.TestCase):
         pass
 
 
+class LazyAggregateTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # monkey-patch ofxtools.models so Aggregate.from_etree() picks up
+        # our fake OFX aggregates/elements
+        models.TESTSUBAGGREGATE = TESTSUBAGGREGATE
+        models.TESTAGGREGATE = TESTAGGREGATE
+
+    @classmethod
+    def tearDownClass(cls):
+        # Remove monkey patch
+        del models.TESTSUBAGGREGATE
+        del models.TESTAGGREGATE
+
+    @property
+    def etree(self):
+        root = ET.Element("TESTAGGREGATE")
+        ET.SubElement(root, "METADATA").text = "metadata"
+        ET.SubElement(root, "REQ00").text = "Y"
+        ET.SubElement(root, "REQ11").text = "N"
+        sub = ET.SubElement(root, "TESTSUBAGGREGATE")
+        ET.SubElement(sub, "DATA").text = "data"
+        return root
+
+    def testInitWrongType(self):
+        with self.assertRaises(TypeError):
+            LazyAggregate(None)
+
+    def testInitUnknownTag(self):
+        with self.assertRaises(OFXSpecError):
+            LazyAggregate(ET.Element("NOSUCHAGGREGATE"))
+
+    def testSubaggregate(self):
+        # SubAggregates are converted from their own subtree, without
+        # converting (or validating) the rest of the tree.
+        root = self.etree
+        root.remove(root.find("METADATA"))
+        proxy = LazyAggregate(root)
+        subagg = proxy.testsubaggregate
+        self.assertIsInstance(subagg, TESTSUBAGGREGATE)
+        self.assertEqual(subagg.data, "data")
+        # Memoized
+        self.assertIs(proxy.testsubaggregate, subagg)
+
+        # Anything else requires the whole tree
+        with self.assertRaises(Types.OFXSpecError):
+            proxy.metadata
+
+    def testSubaggregateReused(self):
+        # SubAggregates converted on demand are incorporated in the full
+        # conversion, rather than converted again.
+        proxy = LazyAggregate(self.etree)
+        subagg = proxy.testsubaggregate
+        instance = proxy.aggregate
+        self.assertIs(instance.testsubaggregate, subagg)
+        self.assertIs(proxy.testsubaggregate, subagg)
+
+    def testSubaggregateMissing(self):
+        root = self.etree
+        root.remove(root.find("TESTSUBAGGREGATE"))
+        proxy = LazyAggregate(root)
+        self.assertIsNone(proxy.testsubaggregate)
+
+    def testAggregate(self):
+        proxy = LazyAggregate(self.etree)
+        self.assertEqual(proxy.metadata, "metadata")
+        self.assertEqual(proxy.req00, True)
+        self.assertEqual(proxy.req11, False)
+        instance = proxy.aggregate
+        self.assertIsInstance(instance, TESTAGGREGATE)
+        self.assertIs(proxy.aggregate, instance)
+        self.assertEqual(repr(proxy), repr(instance))
+        self.assertEqual(len(proxy), 0)
+
+    def testGetattrPrivate(self):
+        proxy = LazyAggregate(self.etree)
+        with self.assertRaises(AttributeError):
+            proxy._spec_repr
+
+
 class SubAggregateTestCase(unittest.TestCase):
     @property
     def instance(self):
@@ -72,41 +72,23 @@ class MailTestCase(unittest.TestCase, base.TestAggregate):
             usehtml=False,
         )
 
-    #  def testToEtree(cls):
-    #  # "frm" gets translated back to FROM in etree
-    #  root = MAIL(
-    #  userid="somebody",
-    #  dtcreated=datetime(1999, 9, 9, 11, tzinfo=UTC),
-    #  frm="rolltide420@yahoo.com",
-    #  to="support@ubs.com",
-    #  subject="I've got a problem",
-    #  msgbody="All my money is gone",
-    #  incimages=False,
-    #  usehtml=False,
-    #  )
-    #  root = root.to_etree()
-    #  #  frm = root.find("./FROM")
-    #  #  cls.assertIsNotNone(frm)
-    #  #  cls.assertEqual(frm.text, "rolltide420@yahoo.com")
-    #  #  frm = root.find("./FRM")
-    #  #  cls.assertIsNone(frm)
-    #  ofx = ET.tostring(root).decode()
-    #  cls.maxDiff = None
-    #  cls.assertEqual(
-    #  ofx,
-    #  (
-    #  "<MAIL>"
-    #  "<USERID>somebody</USERID>"
-    #  "<DTCREATED>19990909110000.000[0:GMT]</DTCREATED>"
-    #  "<FROM>rolltide420@yahoo.com</FROM>"
-    #  "<TO>support@ubs.com</TO>"
-    #  "<SUBJECT>I've got a problem</SUBJECT>"
-    #  "<MSGBODY>All my money is gone</MSGBODY>"
-    #  "<INCIMAGES>N</INCIMAGES>"
-    #  "<USEHTML>N</USEHTML>"
-    #  "</MAIL>"
-    #  ),
-    #  )
+    def testGroom(self):
+        # FROM (reserved Python keyword) is renamed to FRM for conversion,
+        # leaving the input untouched.
+        root = self.etree
+        groomed = MAIL.groom(root)
+        self.assertIsNone(groomed.find("./FROM"))
+        self.assertEqual(groomed.find("./FRM").text, "rolltide420@yahoo.com")
+        self.assertIsNone(root.find("./FRM"))
+        self.assertEqual(root.find("./FROM").text, "rolltide420@yahoo.com")
+
+    def testUngroom(self):
+        # "frm" gets translated back to FROM in etree
+        root = self.aggregate.to_etree()
+        frm = root.find("./FROM")
+        self.assertIsNotNone(frm)
+        self.assertEqual(frm.text, "rolltide420@yahoo.com")
+        self.assertIsNone(root.find("./FRM"))
 
 
 class MailrqTestCase(unittest.TestCase, base.TestAggregate):
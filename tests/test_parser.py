@@ -19,7 +19,6 @@ class TreeBuilderRegexTestCase(TestCase):
 
     def setUp(self):
         self.builder = TreeBuilder()
-        self.builder._feedmatch = MagicMock()
         self.regex = self.builder.regex
 
     def tearDown(self):
@@ -27,53 +26,82 @@ class TreeBuilderRegexTestCase(TestCase):
         del self.builder
 
     def _parsetag(self, markup):
-        """ Call regex.match() on input string; return match groups """
+        """ Call regex.match() on input string; return nonempty match groups """
         m = self.regex.match(markup)
         self.assertIsNotNone(m)
         groupdict = m.groupdict()
-        self.assertEqual(len(groupdict), 4)
-        return (groupdict["tag"], groupdict["text"], groupdict["closetag"])
+        self.assertEqual(len(groupdict), 5)
+        return {k: v for k, v in groupdict.items() if v is not None}
 
     def test_sgml_tag(self):
         markup = "<TAG>data"
         parsed = self._parsetag(markup)
-        self.assertEqual(parsed, ("TAG", "data", None))
+        self.assertEqual(parsed, {"elemtag": "TAG", "text": "data"})
 
     def test_sgml_endtag(self):
         markup = "</TAG>data"
         parsed = self._parsetag(markup)
-        self.assertEqual(parsed, ("/TAG", "data", None))
+        self.assertEqual(parsed, {"endtag": "TAG", "tail": "data"})
 
     def test_xml_tag(self):
         markup = "<TAG>data</TAG>"
         parsed = self._parsetag(markup)
-        self.assertEqual(parsed, ("TAG", "data", "TAG"))
+        self.assertEqual(parsed, {"elemtag": "TAG", "text": "data"})
+
+    def test_xml_tag_whitespace(self):
+        markup = "<TAG> data \n</TAG>"
+        parsed = self._parsetag(markup)
+        self.assertEqual(parsed, {"elemtag": "TAG", "text": "data"})
 
     def test_xml_mismatched_endtag(self):
         markup = "<TAG>data</GAT>"
         parsed = self._parsetag(markup)
-        self.assertEqual(parsed, ("TAG", "data", None))
+        self.assertEqual(parsed, {"elemtag": "TAG", "text": "data"})
+
+    def test_xml_empty_aggregate(self):
+        markup = "<TAG></TAG>"
+        parsed = self._parsetag(markup)
+        self.assertEqual(parsed, {"starttag": "TAG"})
+
+    def test_aggregate_start(self):
+        markup = "<TAG>\n<GAT>"
+        parsed = self._parsetag(markup)
+        self.assertEqual(parsed, {"starttag": "TAG"})
 
     def test_xml_selfclosing_tag(self):
         markup = "<TAG />"
         parsed = self._parsetag(markup)
-        self.assertEqual(parsed, ("TAG /", None, None))
+        self.assertEqual(parsed, {"starttag": "TAG /"})
 
-    def test_finditer_sgml(self):
+    def test_findall_sgml(self):
         markup = "<TAG1><TAG2>value"
-        self.builder.feed(markup)
-        expected = [call("TAG1", None, None), call("TAG2", "value", None)]
-        self.assertEqual(self.builder._feedmatch.mock_calls, expected)
+        tokens = self.regex.findall(markup)
+        expected = [("", "", "", "", "TAG1"), ("TAG2", "value", "", "", "")]
+        self.assertEqual(tokens, expected)
 
-    def test_finditer_xml(self):
+    def test_findall_xml(self):
         markup = "<TAG1><TAG2>value</TAG2></TAG1>"
-        self.builder.feed(markup)
+        tokens = self.regex.findall(markup)
         expected = [
-            call("TAG1", None, None),
-            call("TAG2", "value", "TAG2"),
-            call("/TAG1", None, None),
+            ("", "", "", "", "TAG1"),
+            ("TAG2", "value", "", "", ""),
+            ("", "", "TAG2", "", ""),
+            ("", "", "TAG1", "", ""),
         ]
-        self.assertEqual(self.builder._feedmatch.mock_calls, expected)
+        self.assertEqual(tokens, expected)
+
+    def test_findall_tail(self):
+        markup = "</TAG1> tail"
+        tokens = self.regex.findall(markup)
+        expected = [("", "", "TAG1", "tail", "")]
+        self.assertEqual(tokens, expected)
+
+    def test_findall_unrecognized(self):
+        # Text following markup other than an end tag isn't a tail
+        markup = "<TAG1><tag2>value<TAG3 a='1'>value</TAG1>"
+        tokens = self.regex.findall(markup)
+        expected = [("", "", "", "", "TAG1"), ("", "", "TAG1", "", "")]
+        self.assertEqual(tokens, expected)
 
 
 class TreeBuilderUnitTestCase(TestCase):
@@ -83,88 +111,123 @@ class TreeBuilderUnitTestCase(TestCase):
         builder = TreeBuilder()
         builder.start = MagicMock()
         builder.data = MagicMock()
-        builder.end = MagicMock()
+        # ET.TreeBuilder.end() returns the Element it closes
+        builder.end = MagicMock(side_effect=Element)
 
         self.builder = builder
 
     def tearDown(self):
         del self.builder
 
-    def test_groomstring(self):
-        groom = self.builder._groomstring
-        self.assertEqual(None, groom(None))
-        self.assertEqual(None, groom(""))
-        self.assertEqual(None, groom("   \n"))
-        self.assertEqual("text", groom("text   \n"))
-        self.assertEqual("text", groom("   \ntext"))
-
     def test_start_agg(self):
-        (tag, text, closetag) = ("TAG", None, None)
-        self.builder._start(tag, text, closetag)
+        self.builder.feed("<TAG>")
         self.builder.start.assert_called_once_with("TAG", {})
         self.builder.data.assert_not_called()
         self.builder.end.assert_not_called()
 
+    def test_end_agg(self):
+        self.builder.feed("</TAG>")
+        self.builder.start.assert_not_called()
+        self.builder.data.assert_not_called()
+        self.builder.end.assert_called_once_with("TAG")
+
     def test_empty_aggV2(self):
-        (tag, text, closetag) = ("TAG", None, "TAG")
-        self.builder._start(tag, text, closetag)
+        self.builder.feed("<TAG></TAG>")
         self.builder.start.assert_called_once_with("TAG", {})
         self.builder.data.assert_not_called()
         self.builder.end.assert_called_once_with("TAG")
 
     def test_elemV1(self):
-        (tag, text, closetag) = ("TAG", "value", None)
-        self.builder._start(tag, text, closetag)
+        self.builder.feed("<TAG>value")
         self.builder.start.assert_called_once_with("TAG", {})
         self.builder.data.assert_called_once_with("value")
         self.builder.end.assert_called_once_with("TAG")
 
     def test_elemV2(self):
-        (tag, text, closetag) = ("TAG", "value", "TAG")
-        self.builder._start(tag, text, closetag)
+        self.builder.feed("<TAG>value</TAG>")
         self.builder.start.assert_called_once_with("TAG", {})
         self.builder.data.assert_called_once_with("value")
         self.builder.end.assert_called_once_with("TAG")
 
-    def test_feedmatch_empty_tag(self):
-        (tag, text, closetag) = (None, "value", "TAG")
-        with self.assertRaises(AssertionError):
-            self.builder._feedmatch(tag, text, closetag)
-
-    def test_feedmatch_tag_mismatch(self):
-        (tag, text, closetag) = ("TAG", "value", "GAT")
-        with self.assertRaises(AssertionError):
-            self.builder._feedmatch(tag, text, closetag)
-
-    def test_feedmatch_start(self):
-        self.builder._start = MagicMock()
-        (tag, text, closetag) = ("TAG", "value", "TAG")
-        self.builder._feedmatch(tag, text, closetag)
-        self.builder._start.assert_called_once_with("TAG", "value", "TAG")
-        self.builder.end.assert_not_called()
-
-    def test_feedmatch_end(self):
-        self.builder._start = MagicMock()
-        (tag, text, closetag) = ("/TAG", None, None)
-        self.builder._feedmatch(tag, text, closetag)
-        self.builder._start.assert_not_called()
+    def test_elem_whitespace(self):
+        self.builder.feed("<TAG>\n  value  \n")
+        self.builder.start.assert_called_once_with("TAG", {})
+        self.builder.data.assert_called_once_with("value")
         self.builder.end.assert_called_once_with("TAG")
 
-    def test_feedmatch_end_tail(self):
-        (tag, text, closetag) = ("/TAG", "value", None)
+    def test_elemV2_mismatched_endtag(self):
+        self.builder.feed("<TAG>value</GAT>")
+        self.builder.start.assert_called_once_with("TAG", {})
+        self.builder.data.assert_called_once_with("value")
+        self.assertEqual(self.builder.end.mock_calls, [call("TAG"), call("GAT")])
+
+    def test_elemV2_parent_endtag(self):
+        self.builder.feed("<TAG><TAG2>value</TAG2></TAG>")
+        self.assertEqual(self.builder.end.mock_calls, [call("TAG2"), call("TAG")])
+
+    def test_end_agg_mismatched(self):
+        self.builder.end = MagicMock(return_value=Element("TAG"))
+        self.builder.feed("</GAT>")
+        self.builder.end.assert_called_once_with("GAT")
+
+    def test_end_agg_mismatched_strict(self):
+        self.builder.strict = True
+        self.builder.end = MagicMock(return_value=Element("TAG"))
         with self.assertRaises(ParseError):
-            self.builder._feedmatch(tag, text, closetag)
+            self.builder.feed("</GAT>")
+
+    def test_elem_private(self):
+        self.builder.feed("<TAG><INTU.BID>3000</INTU.BID><INTU.USERID>jdoe</TAG>")
+        self.builder.start.assert_called_once_with("TAG", {})
+        self.builder.data.assert_not_called()
+        self.builder.end.assert_called_once_with("TAG")
+
+    def test_elem_private_keep(self):
+        self.builder.skip_private = False
+        self.builder.feed("<INTU.BID>3000</INTU.BID>")
+        self.builder.start.assert_called_once_with("INTU.BID", {})
+        self.builder.data.assert_called_once_with("3000")
+        self.builder.end.assert_called_once_with("INTU.BID")
+
+    def test_elem_bytes(self):
+        self.builder.codec = "cp1252"
+        self.builder.feed(b"<TAG>caf\xe9</TAG>")
+        self.builder.start.assert_called_once_with("TAG", {})
+        self.builder.data.assert_called_once_with("caf\xe9")
+        self.builder.end.assert_called_once_with("TAG")
+
+    def test_elem_unicode_whitespace(self):
+        self.builder.codec = "cp1252"
+        self.builder.feed(b"<NAME>\xa0Foo\xa0\r\n</NAME>")
+        self.builder.data.assert_called_once_with("Foo")
 
     def test_close_tail(self):
         data = "</FOO>illegal"
         with self.assertRaises(ParseError):
             self.builder.feed(data)
 
+    def test_close_tail_whitespace(self):
+        data = "</FOO>\n illegal"
+        with self.assertRaises(ParseError):
+            self.builder.feed(data)
+
     def test_open_tail(self):
         data = "<FOO>bar</FOO>illegal"
         with self.assertRaises(ParseError):
             self.builder.feed(data)
 
+    def test_lowercase_tag(self):
+        # Unrecognized markup is skipped, along with any text following it
+        self.builder.feed("<OFX><code>0</OFX>")
+        self.builder.start.assert_called_once_with("OFX", {})
+        self.builder.data.assert_not_called()
+        self.builder.end.assert_called_once_with("OFX")
+
+    def test_open_tail_bytes(self):
+        data = b"<FOO>bar</FOO>illegal"
+        with self.assertRaises(ParseError):
+            self.builder.feed(data)
+
 
 class TreeBuilderUnitFunctionalTestCase(TestCase):
     """ Functional tests for ofxtools.Parser.Treebuilder """
@@ -320,6 +383,70 @@ class TreeBuilderUnitFunctionalTestCase(TestCase):
         )
         self._testFeedSonrs(body)
 
+    def testFeedBytes(self):
+        """
+        TreeBuilder.feed() correctly parses soup fed as undecoded bytes.
+        """
+        body = (
+            b"<OFX>\r\n"
+            b"<SIGNONMSGSRSV1>\r\n"
+            b"<SONRS>\r\n"
+            b"<STATUS>\r\n"
+            b"<CODE>0\r\n"
+            b"<SEVERITY>INFO</SEVERITY>\r\n"
+            b"</STATUS>\r\n"
+            b"<DTSERVER>20051029101003\r\n"
+            b"<LANGUAGE>ENG\r\n"
+            b"<DTPROFUP>19991029101003</DTPROFUP>\r\n"
+            b"<DTACCTUP>20031029101003\r\n"
+            b"<FI>\r\n"
+            b"<ORG>NCH\r\n"
+            b"<FID>1001\r\n"
+            b"</FI>\r\n"
+            b"</SONRS>\r\n"
+            b"</SIGNONMSGSRSV1>\r\n"
+            b"</OFX>\r\n"
+        )
+        self._testFeedSonrs(body)
+
+    def testFeedMissingEndTag(self):
+        """
+        By default, an end tag not matching the open aggregate closes it
+        anyway, e.g. the OFX spec's sample 401(k) statement omits
+        </YEARTODATE> (cf. test_spec_invest.Inc401kResponseTestCase).
+        """
+        builder = TreeBuilder()
+        builder.feed(
+            "<INV401KSUMMARY><YEARTODATE><CONTRIBUTIONS><TOTAL>1</TOTAL>"
+            "</CONTRIBUTIONS></INV401KSUMMARY>"
+        )
+        root = builder.close()
+        self.assertEqual(root.tag, "INV401KSUMMARY")
+        [yeartodate] = root
+        self.assertEqual(yeartodate.tag, "YEARTODATE")
+        [contributions] = yeartodate
+        self.assertEqual(contributions.tag, "CONTRIBUTIONS")
+        self.assertEqual(contributions.find("TOTAL").text, "1")
+
+    def testFeedMismatchedEndTagStrict(self):
+        """
+        In strict mode, an end tag not matching the open aggregate raises
+        ParseError.
+        """
+        builder = TreeBuilder(strict=True)
+        with self.assertRaises(ParseError) as cm:
+            builder.feed("<OFX><SONRS><STATUS><CODE>0</CODE></SONRS></OFX>")
+        self.assertIn("</STATUS>", str(cm.exception))
+
+    def testFeedUnmatchedEndTag(self):
+        """
+        An end tag closing no open aggregate raises ParseError.
+        """
+        builder = TreeBuilder()
+        with self.assertRaises(ParseError) as cm:
+            builder.feed("<OFX><CODE>0</CODE></OFX></SONRS>")
+        self.assertIn("</SONRS>", str(cm.exception))
+
 
 class OFXTreeTestCase(TestCase):
     def setUp(self):
@@ -333,7 +460,8 @@ class OFXTreeTestCase(TestCase):
         # the OFX data to TreeBuilder, and stores the return value from
         # TreeBuilder.close() as its _root
         self.tree._read = MagicMock()
-        self.tree._read.return_value = (sentinel.header, sentinel.ofx)
+        chunks = (chunk for chunk in [sentinel.ofx1, sentinel.ofx2])
+        self.tree._read.return_value = (sentinel.header, chunks)
 
         mockTreeBuilderClass = MagicMock()
         mockTreeBuilderInstance = mockTreeBuilderClass.return_value
@@ -342,44 +470,114 @@ class OFXTreeTestCase(TestCase):
         source = "/path/to/file.ofx"
         self.tree.parse(source, parser=mockTreeBuilderInstance)
         self.tree._read.assert_called_once_with(source)
-        mockTreeBuilderInstance.feed.assert_called_once_with(sentinel.ofx)
+        self.assertEqual(
+            mockTreeBuilderInstance.feed.mock_calls,
+            [call(sentinel.ofx1), call(sentinel.ofx2)],
+        )
         # FIXME - Fails on Python 3.5 ???
         #  mockTreeBuilderInstance.close.assert_called_once()
         self.assertEqual(self.tree._root, sentinel.root)
 
-    def test_read_filename(self):
+    def test_parse_error_closes_file(self):
+        # A file opened by OFXTree.parse() is closed even if parsing fails
         with patch("builtins.open") as fake_open:
-            with patch("ofxtools.Parser.parse_header") as fake_parse_header:
-                fake_open.return_value = sentinel.file
+            with patch("ofxtools.Parser.read_header") as fake_read_header:
+                fake_file = fake_open.return_value
+                fake_file.mode = "rb"
+                fake_file.read.side_effect = [b"<OFX>", b"</FOO>illegal", b""]
+                fake_read_header.return_value = MagicMock(codec="utf_8")
+
+                # Check while the traceback (which references the parse()
+                # frame) is still alive.
+                try:
+                    self.tree.parse("/path/to/file.ofx")
+                except ParseError:
+                    fake_file.close.assert_called_once_with()
+                else:
+                    self.fail("ParseError not raised")
+
+    def test_parse_parser_codec(self):
+        # A TreeBuilder passed in by the caller decodes element text according
+        # to the charset declared by the OFX header, same as the default.
+        source = BytesIO(
+            b"OFXHEADER:100\r\n"
+            b"DATA:OFXSGML\r\n"
+            b"VERSION:102\r\n"
+            b"SECURITY:NONE\r\n"
+            b"ENCODING:USASCII\r\n"
+            b"CHARSET:1252\r\n"
+            b"COMPRESSION:NONE\r\n"
+            b"OLDFILEUID:NONE\r\n"
+            b"NEWFILEUID:NONE\r\n"
+            b"\r\n"
+            b"<OFX><ORG>Caf\xe9</OFX>\r\n"
+        )
+        root = self.tree.parse(source, parser=TreeBuilder(skip_private=False))
+        self.assertEqual(root.find("ORG").text, "Caf\xe9")
 
-                fake_header = sentinel.header
-                fake_body = sentinel.ofx
-                fake_parse_header.return_value = (fake_header, fake_body)
+    def test_read_filename(self):
+        with patch("builtins.open") as fake_open:
+            with patch("ofxtools.Parser.read_header") as fake_read_header:
+                fake_file = fake_open.return_value
+                fake_file.mode = "rb"
+                fake_file.read.side_effect = [b"<OFX>", b""]
+                fake_read_header.return_value = sentinel.header
 
                 source = NamedTemporaryFile()
                 source.write(b"a bunch of text")
                 source.seek(0)
 
-                output = self.tree._read(source.name)
+                header, chunks = self.tree._read(source.name)
                 source.close()
                 fake_open.assert_called_once_with(source.name, "rb")
-                fake_parse_header.assert_called_once_with(sentinel.file)
-                self.assertEqual(output, (fake_header, fake_body))
+                fake_read_header.assert_called_once_with(fake_file)
+                self.assertEqual(header, sentinel.header)
+                self.assertEqual(list(chunks), [b"<OFX>"])
+                fake_file.close.assert_called_once_with()
 
     def test_read_file(self):
-        with patch("ofxtools.Parser.parse_header") as fake_parse_header:
-            fake_header = sentinel.header
-            fake_body = sentinel.ofx
-            fake_parse_header.return_value = (fake_header, fake_body)
+        with patch("ofxtools.Parser.read_header") as fake_read_header:
+            fake_read_header.return_value = sentinel.header
 
             source = NamedTemporaryFile()
             source.write(b"a bunch of text")
             source.seek(0)
 
-            output = self.tree._read(source)
+            header, chunks = self.tree._read(source)
+            self.assertEqual(list(chunks), [b"a bunch of text"])
             source.close()
-            fake_parse_header.assert_called_once_with(source)
-            self.assertEqual(output, (fake_header, fake_body))
+            fake_read_header.assert_called_once_with(source)
+            self.assertEqual(header, sentinel.header)
+
+    def test_read_chunks(self):
+        with patch("ofxtools.Parser.read_header") as fake_read_header:
+            fake_read_header.return_value = sentinel.header
+
+            source = BytesIO(b"<OFX><CODE>0<SEVERITY>INFO</OFX>")
+            header, chunks = self.tree._read(source, chunksize=8)
+            # Chunks are cut before '<' so that they hold complete tokens
+            self.assertEqual(
+                list(chunks),
+                [b"<OFX>", b"<CODE>0", b"<SEVERITY>INFO", b"</OFX>"],
+            )
+
+    def test_read_chunks_error_position(self):
+        # ParseError positions are counted from the start of the message
+        # body, not the start of the chunk in which the error occurs.
+        with patch("ofxtools.Parser.read_header") as fake_read_header:
+            fake_read_header.return_value = sentinel.header
+
+            body = b"<OFX><CODE>0<SEVERITY>INFO</SEVERITY>illegal</OFX>"
+            source = BytesIO(body)
+            header, chunks = self.tree._read(source, chunksize=8)
+            builder = TreeBuilder()
+            with self.assertRaises(ParseError) as cm:
+                for chunk in chunks:
+                    builder.feed(chunk)
+            start = body.index(b"illegal")
+            end = start + len(b"illegal")
+            self.assertIn(f"position=[{start}:{end}]", str(cm.exception))
+            self.assertIn("</SEVERITY>illegal", str(cm.exception))
 
     def test_read_not_bytes(self):
         source = NamedTemporaryFile(mode="w+")
@@ -391,18 +589,17 @@ class OFXTreeTestCase(TestCase):
 
     def test_read_byteslike(self):
         # PR #15
-        with patch("ofxtools.Parser.parse_header") as fake_parse_header:
-            fake_header = sentinel.header
-            fake_body = sentinel.ofx
-            fake_parse_header.return_value = (fake_header, fake_body)
+        with patch("ofxtools.Parser.read_header") as fake_read_header:
+            fake_read_header.return_value = sentinel.header
 
             source = BytesIO(b"a bunch of text")
             source.seek(0)
 
-            output = self.tree._read(source)
+            header, chunks = self.tree._read(source)
+            self.assertEqual(list(chunks), [b"a bunch of text"])
             source.close()
-            fake_parse_header.assert_called_once_with(source)
-            self.assertEqual(output, (fake_header, fake_body))
+            fake_read_header.assert_called_once_with(source)
+            self.assertEqual(header, sentinel.header)
 
     def test_read_illegal(self):
         source = "a bunch of text"
@@ -419,6 +616,16 @@ class OFXTreeTestCase(TestCase):
             MockAggregate.from_etree.assert_called_once_with(self.tree._root)
             self.assertEqual(ofx, MockAggregate.from_etree())
 
+    def test_convert_lazy(self):
+        # Fake the result of OFXTree.parse()
+        self.tree._root = Element("FAKE")
+
+        # OFXTree.convert(lazy=True) returns a LazyAggregate proxying its root
+        with patch("ofxtools.Parser.LazyAggregate") as MockLazyAggregate:
+            ofx = self.tree.convert(lazy=True)
+            MockLazyAggregate.assert_called_once_with(self.tree._root)
+            self.assertEqual(ofx, MockLazyAggregate())
+
     def test_convert_unparsed(self):
         # Calling OFXTree.convert() without first calling OFXTree.parse()
         # raises ValueError